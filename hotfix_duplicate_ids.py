@@ -3,7 +3,6 @@
 Hotfix for Streamlit duplicate element ID error.
 """
 
-import re
 from pathlib import Path
 
 
@@ -21,14 +20,12 @@ def fix_ui_components():
         content = f.read()
 
     # Fix 1:  unique key to plotly_chart
-    old_plotly = r"st\.plotly_chart\(fig, use_container_width=True\)"
-    new_plotly = 'st.plotly_chart(fig, use_container_width=True, key=f"plot_{technique}_{hash(str(df.columns))}")'
-    content = re.sub(old_plotly, new_plotly, content)
+    new_plotly = 'st.plotly_chart(fig, use_container_width=True, key=f"plot_{technique}_{hash(tuple(df.columns))}")'
+    content = content.replace("st.plotly_chart(fig, use_container_width=True)", new_plotly)
 
     # Fix 2: unique key to dataframe
-    old_dataframe = r"st\.dataframe\(df\.head\(10\)\)"
-    new_dataframe = 'st.dataframe(df.head(10), key=f"dataframe_{technique}_{hash(str(df.shape))}")'
-    content = re.sub(old_dataframe, new_dataframe, content)
+    new_dataframe = 'st.dataframe(df.head(10), key=f"dataframe_{technique}_{hash(df.shape)}")'
+    content = content.replace("st.dataframe(df.head(10))", new_dataframe)
 
     # Write back
     with open(ui_file, "w", encoding="utf-8") as f:
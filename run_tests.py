@@ -5,8 +5,10 @@ Test runner for EChem FAIRifier.
 Provides different levels of testing with clear output.
 """
 import os
+import runpy
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 if os.name == "nt":
@@ -14,18 +16,25 @@ if os.name == "nt":
     sys.stdout.reconfigure(encoding="utf-8")
 
 
+def get_xdist_args():
+    """Return pytest-xdist arguments if the plugin is installed."""
+    try:
+        import xdist  # noqa: F401
+    except ImportError:
+        return []
+    return ["-n", "auto", "--dist", "loadfile"]
+
+
 def run_setup_test():
     """Run the basic setup test."""
     print("🔄 Running setup validation...")
     try:
-        result = subprocess.run([sys.executable, "test_setup.py"], capture_output=True, text=True)
-        if result.returncode == 0:
+        setup_module = runpy.run_path("test_setup.py")
+        if setup_module["main"]():
             print("✅ Setup test passed!")
             return True
         else:
             print("❌ Setup test failed!")
-            print(result.stdout)
-            print(result.stderr)
             return False
     except Exception as e:
         print(f"❌ Error running setup test: {e}")
@@ -36,18 +45,9 @@ def run_unit_tests():
     """Run unit tests with pytest."""
     print("🔄 Running unit tests...")
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"],
-            capture_output=True,
-            text=True,
-        )
-
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings/Errors:")
-            print(result.stderr)
+        import pytest
 
-        return result.returncode == 0
+        return pytest.main(["tests/", "-v", "--tb=short", *get_xdist_args()]) == 0
     except Exception as e:
         print(f"❌ Error running unit tests: {e}")
         return False
@@ -58,28 +58,14 @@ def run_coverage_tests():
     print("🔄 Running tests with coverage...")
     try:
         # Install coverage if not available
-        subprocess.run([sys.executable, "-m", "pip", "install", "pytest-cov"], capture_output=True)
-
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "pytest",
-                "tests/",
-                "-v",
-                "--cov=src/",
-                "--cov-report=term-missing",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        try:
+            import pytest_cov  # noqa: F401
+        except ImportError:
+            subprocess.run([sys.executable, "-m", "pip", "install", "pytest-cov"], capture_output=True)
 
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings/Errors:")
-            print(result.stderr)
+        import pytest
 
-        return result.returncode == 0
+        return pytest.main(["tests/", "-v", "--cov=src/", "--cov-report=term-missing", *get_xdist_args()]) == 0
     except Exception as e:
         print(f"❌ Error running coverage tests: {e}")
         return False
@@ -102,10 +88,17 @@ def run_code_quality_checks():
 
     all_passed = True
 
-    for check_name, command in checks:
-        try:
+    # Checks are independent subprocesses, so run them concurrently and
+    # report in the declared order once they have all finished
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {}
+        for check_name, command in checks:
             print(f"  Running {check_name}...")
-            result = subprocess.run(command, capture_output=True, text=True)
+            futures[check_name] = executor.submit(subprocess.run, command, capture_output=True, text=True)
+
+    for check_name, _ in checks:
+        try:
+            result = futures[check_name].result()
             if result.returncode == 0:
                 print(f"  ✅ {check_name} passed")
             else:
@@ -130,18 +123,18 @@ def install_dev_dependencies():
     dev_packages = [
         "pytest>=7.0.0",
         "pytest-cov>=4.0.0",
+        "pytest-xdist>=3.0.0",
         "black>=22.0.0",
         "flake8>=5.0.0",
         "mypy>=1.0.0",
     ]
 
     try:
-        for package in dev_packages:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", package],
-                capture_output=True,
-                check=True,
-            )
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", *dev_packages],
+            capture_output=True,
+            check=True,
+        )
         print("✅ Development dependencies installed!")
         return True
     except subprocess.CalledProcessError as e:
@@ -2,10 +2,24 @@ import streamlit as st
 import yaml
 import pandas as pd
 from io import BytesIO
+import json
+import shutil
+import time
 import zipfile
 
-st.markdown(
-    """
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+st.set_page_config(page_title="EChem FAIRifier", layout="wide")
+
+_CSS = """
 <style>
 .main-header {
     text-align: center;
@@ -20,28 +34,27 @@ st.markdown(
     margin: 1rem 0;
 }
 </style>
-""",
+"""
+
+_FAIR_HELP_MD = """
+**FAIR** stands for:
+- **F**indable: Easy to locate and identify
+- **A**ccessible: Retrievable by identifier using standard protocols
+- **I**nteroperable: Data can be integrated with other data
+- **R**eusable: Well-described so that it can be replicated/combined
+This tool helps make your electrochemical data FAIR by adding standardised metadata.
+"""
+
+st.markdown(_CSS, unsafe_allow_html=True)
+st.subheader("A Project by Amin Haghighatbin", divider=True, width=400)
+st.markdown(
+    '<div class="main-header"><h1>⚡ EChem FAIRifier</h1>'
+    "<p><strong>Making electrochemical data FAIR-compliant</strong></p></div>",
     unsafe_allow_html=True,
 )
-st.subheader("A Project by Amin Haghighatbin", divider=True, width=400)
-st.markdown('<div class="main-header">', unsafe_allow_html=True)
-st.title("⚡ EChem FAIRifier")
-st.markdown("**Making electrochemical data FAIR-compliant**")
-st.markdown("</div>", unsafe_allow_html=True)
 
 with st.expander("ℹ️ What is FAIR data?"):
-    st.markdown(
-        """
-    **FAIR** stands for:
-    - **F**indable: Easy to locate and identify
-    - **A**ccessible: Retrievable by identifier using standard protocols
-    - **I**nteroperable: Data can be integrated with other data
-    - **R**eusable: Well-described so that it can be replicated/combined
-    This tool helps make your electrochemical data FAIR by adding standardised metadata.
-    """
-    )
-
-st.set_page_config(page_title="EChem FAIRifier", layout="wide")
+    st.markdown(_FAIR_HELP_MD)
 
 TECHNIQUE_PARAMETERS = {
     "CV": {
@@ -67,34 +80,87 @@ TECHNIQUE_PARAMETERS = {
     "CA": {"step_potentials": [0.0, 0.5], "step_times": [5, 60], "total_duration": 65},
 }
 
+# Widget defaults per technique, with list values pre-joined for the text inputs
+_DEFAULT_STRS = {
+    tech: {param: (", ".join(map(str, value)) if isinstance(value, list) else value) for param, value in params.items()}
+    for tech, params in TECHNIQUE_PARAMETERS.items()
+}
 
-col1, col2 = st.columns([1, 1])
-with col1:
-    # --- File upload ---
-    uploaded_file = st.file_uploader("Upload CV/EIS data (.csv)", type="csv")
-    # --- Shared Metadata Fields ---
-    technique = st.selectbox("Select Technique", list(TECHNIQUE_PARAMETERS.keys()))
-    electrolyte = st.text_input("Electrolyte", "3 mM [FeCN6] in 0.1 M KNO3")
-    working_electrode = st.text_input("Working Electrode", "Glassy carbon, 3 mm")
-    reference_electrode = st.text_input("Reference Electrode", "Ag/AgCl")
-    counter_electrode = st.text_input("Counter Electrode", "Platinum wire")
-
-
-with col2:
-    st.subheader("Technique Parameters")
-    custom_params = {}
-    for param, default in TECHNIQUE_PARAMETERS[technique].items():
-        if isinstance(default, list):
-            val = st.text_input(
-                f"{param.replace('_', ' ').title()} (comma-separated)",
-                ", ".join(map(str, default)),
-            )
-            custom_params[param] = [float(x.strip()) for x in val.split(",") if x.strip()]
-        else:
-            custom_params[param] = st.number_input(f"{param.replace('_', ' ').title()}", value=default)
+_REQUIRED_COLS = frozenset(("Potential (V)", "Current (A)"))
+
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=8)
+def _load_csv(file_id: str, _data_file) -> pd.DataFrame:
+    _data_file.seek(0)
+    try:
+        return pd.read_csv(_data_file, engine="pyarrow")
+    except (ImportError, ValueError):
+        # pyarrow missing or unable to parse: fall back to the default C engine
+        _data_file.seek(0)
+        return pd.read_csv(_data_file)
+
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=8)
+def _dump_yaml(metadata: dict) -> str:
+    return yaml.dump(metadata, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=8)
+def _dump_json(metadata: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    return json.dumps(metadata, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=8)
+def _build_bundle(
+    file_id: str, _data_file, metadata_yaml_str: str, metadata_json: bytes, compress: bool = False
+) -> bytes:
+    data_info = zipfile.ZipInfo(_data_file.name, date_time=time.localtime()[:6])
+    data_info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zip_file:
+        zip_file.writestr("metadata.yaml", metadata_yaml_str, compress_type=zipfile.ZIP_STORED)
+        zip_file.writestr("metadata.json", metadata_json, compress_type=zipfile.ZIP_STORED)
+        # Stream the upload into the entry rather than materialising another copy
+        _data_file.seek(0)
+        with zip_file.open(data_info, "w", force_zip64=True) as writer:
+            shutil.copyfileobj(_data_file, writer, 1 << 20)
+    return zip_buffer.getvalue()
+
+
+# --- File upload ---
+uploaded_file = st.file_uploader("Upload CV/EIS data (.csv)", type="csv")
+# Kept outside the form so the parameter inputs follow the selected technique
+technique = st.selectbox("Select Technique", list(TECHNIQUE_PARAMETERS.keys()))
+
+# Buffer field edits so the CSV, YAML and bundle work runs once per submit
+with st.form("fair_form"):
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        # --- Shared Metadata Fields ---
+        electrolyte = st.text_input("Electrolyte", "3 mM [FeCN6] in 0.1 M KNO3")
+        working_electrode = st.text_input("Working Electrode", "Glassy carbon, 3 mm")
+        reference_electrode = st.text_input("Reference Electrode", "Ag/AgCl")
+        counter_electrode = st.text_input("Counter Electrode", "Platinum wire")
+
+    with col2:
+        st.subheader("Technique Parameters")
+        custom_params = {}
+        for param, default in _DEFAULT_STRS[technique].items():
+            if isinstance(default, str):
+                val = st.text_input(f"{param.replace('_', ' ').title()} (comma-separated)", default)
+                custom_params[param] = [float(x.strip()) for x in val.split(",") if x.strip()]
+            else:
+                custom_params[param] = st.number_input(f"{param.replace('_', ' ').title()}", value=default)
+
+    submitted = st.form_submit_button("Generate FAIR Bundle")
+
+if submitted:
+    st.session_state.fair_form_submitted = True
 st.markdown("---")
 col3, col4 = st.columns([1, 1])
-if uploaded_file:
+if uploaded_file and st.session_state.get("fair_form_submitted"):
     metadata = {
         "technique": technique,
         "technique_parameters": custom_params,
@@ -105,19 +171,21 @@ if uploaded_file:
         "dataset_link": uploaded_file.name,
     }
 
-    metadata_yaml_str = yaml.dump(metadata)
+    metadata_yaml_str = _dump_yaml(metadata)
 
     with col3:
         st.subheader("Metadata Preview (YAML)")
         st.code(metadata_yaml_str, language="yaml")
 
     try:
-        df = pd.read_csv(uploaded_file)
-        if {"Potential (V)", "Current (A)"}.issubset(df.columns):
+        df = _load_csv(uploaded_file.file_id, uploaded_file)
+        if _REQUIRED_COLS.issubset(df.columns):
             with col4:
                 st.subheader("Plot Preview")
                 st.scatter_chart(
-                    df.set_index("Potential (V)")["Current (A)"],
+                    df,
+                    x="Potential (V)",
+                    y="Current (A)",
                     x_label="Potential / V",
                     y_label="Current / A",
                 )
@@ -126,21 +194,27 @@ if uploaded_file:
     except Exception as e:
         st.error(f"Error reading CSV for plotting: {e}")
 
-    zip_buffer = BytesIO()
-    try:
-        with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED) as zip_file:
-            zip_file.writestr("metadata.yaml", metadata_yaml_str)
-            zip_file.writestr(uploaded_file.name, uploaded_file.getvalue())
-        zip_buffer.seek(0)
-    except Exception as e:
-        st.error(f"Error creating the zip file: {e}")
+    compress_bundle = st.checkbox("Compress bundle (slower)", value=False)
+    # Only build the zip on request; a stored bundle is offered while its inputs are unchanged
+    bundle_key = (uploaded_file.file_id, metadata_yaml_str, compress_bundle)
+    if st.button("Prepare FAIR Bundle"):
+        try:
+            st.session_state.zip_bytes = _build_bundle(
+                uploaded_file.file_id, uploaded_file, metadata_yaml_str, _dump_json(metadata), compress_bundle
+            )
+            st.session_state.zip_key = bundle_key
+        except Exception as e:
+            st.error(f"Error creating the zip file: {e}")
 
-    st.download_button(
-        label="Download FAIR Bundle (.zip)",
-        data=zip_buffer,
-        file_name="fair_bundle.zip",
-        mime="application/zip",
-    )
+    if st.session_state.get("zip_key") == bundle_key:
+        st.download_button(
+            label="Download FAIR Bundle (.zip)",
+            data=st.session_state.zip_bytes,
+            file_name="fair_bundle.zip",
+            mime="application/zip",
+        )
 
+elif uploaded_file:
+    st.info("Fill in the fields above and press 'Generate FAIR Bundle' to continue.")
 else:
     st.warning("Please upload your electrochemical data file to continue.")
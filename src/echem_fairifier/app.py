@@ -22,14 +22,35 @@ sys.path.insert(0, str(src_dir))
 import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
-import numpy as np
 from io import BytesIO
+import codecs
+import hashlib
+import json
+import shutil
+import tempfile
+import traceback
 import zipfile
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO, List, Optional, Tuple
+
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 from src.echem_fairifier.core.metadata_generator import FAIRMetadataGenerator
 from src.echem_fairifier.core.validator import ECDataValidator
-from src.echem_fairifier.core.emmo_integration import EMMOElectrochemistryIntegration
+from src.echem_fairifier.core.emmo_integration import get_emmo_integration
 from src.echem_fairifier.ui.components import UIComponents
 from src.echem_fairifier._version import __version__, get_version_info
 
@@ -56,6 +77,126 @@ st.set_page_config(
 )
 
 
+LEGACY_ENCODINGS = ["cp1252", "latin_1", "iso8859_15"]
+PREVIEW_ROWS = 500
+DEFAULT_PREVIEW_TECHNIQUE = "CV"
+BUNDLE_SPOOL_BYTES = 16 * 1024 * 1024
+FAST_DEFLATE_BYTES = 1024 * 1024
+YAML_PREVIEW_LINES = 200
+
+
+def _trim_partial_utf8(sample: bytes) -> bytes:
+    """Drop a multi-byte UTF-8 sequence cut off at the end of a sample."""
+    # Step back over continuation bytes (0b10xxxxxx) to the last lead byte
+    start = len(sample) - 1
+    while start >= max(0, len(sample) - 3) and sample[start] & 0xC0 == 0x80:
+        start -= 1
+    if start < 0:
+        return sample
+    lead = sample[start]
+    width = 2 if lead & 0xE0 == 0xC0 else 3 if lead & 0xF0 == 0xE0 else 4 if lead & 0xF8 == 0xF0 else 1
+    return sample[:start] if len(sample) - start < width else sample
+
+
+def detect_encoding(data: bytes, sample_size: int = 65536) -> str:
+    """Detect the text encoding of uploaded bytes from a leading sample."""
+    if data.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+
+    sample = data[:sample_size]
+    if len(sample) < len(data):
+        sample = _trim_partial_utf8(sample)
+    try:
+        sample.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    if from_bytes is not None:
+        # Limit candidates to the single-byte encodings lab software exports
+        best_match = from_bytes(sample, cp_isolation=LEGACY_ENCODINGS).best()
+        if best_match is not None:
+            return best_match.encoding
+
+    return "latin-1"
+
+
+def _read_csv_arrow(data: bytes) -> Optional[pd.DataFrame]:
+    """
+    Parse UTF-8 CSV bytes with pyarrow's multi-threaded reader.
+
+    Returns None when the result would differ from the C engine's, so the caller
+    falls back to it: undecodable text, which Arrow keeps as binary columns, and
+    blank or repeated headers, which pandas renames ("Unnamed: 2", "Comment.1").
+    """
+    table = pa_csv.read_csv(
+        pa.BufferReader(data),
+        parse_options=pa_csv.ParseOptions(delimiter=","),
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+    )
+    names = table.column_names
+    if "" in names or len(set(names)) != len(names):
+        return None
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        return None
+    # All-empty columns are null-typed in Arrow but float64 (all NaN) from the C engine
+    if any(pa.types.is_null(field.type) for field in table.schema):
+        table = table.cast(
+            pa.schema(field.with_type(pa.float64()) if pa.types.is_null(field.type) else field for field in table.schema)
+        )
+    # split_blocks skips the consolidation copy; self_destruct frees Arrow buffers as columns convert
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _read_csv_fast(data: bytes, nrows: Optional[int] = None) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """Read uploaded CSV bytes in one pass, preferring the pyarrow engine for full UTF-8 reads."""
+    encoding = detect_encoding(data)
+
+    # Partial reads use the C engine, which stops once nrows is reached
+    if pa is not None and nrows is None and encoding in ("utf-8", "utf-8-sig"):
+        try:
+            df = _read_csv_arrow(data)
+            if df is not None:
+                return df, encoding
+        except ValueError:
+            # A layout Arrow rejects (ArrowInvalid subclasses ValueError)
+            pass
+
+    try:
+        df = pd.read_csv(BytesIO(data), engine="c", encoding=encoding, nrows=nrows, low_memory=False, cache_dates=True)
+    except UnicodeDecodeError:
+        # The sample was not representative; latin-1 decodes any byte sequence
+        encoding = "latin-1"
+        df = pd.read_csv(BytesIO(data), engine="c", encoding=encoding, nrows=nrows, low_memory=False, cache_dates=True)
+
+    return df, encoding
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=8)
+def load_csv_cached(file_bytes: bytes, filename: str) -> Tuple[Optional[pd.DataFrame], Optional[str], List[str]]:
+    """Parse an uploaded CSV once per distinct file and reuse it across reruns."""
+    df, encoding = _read_csv_fast(file_bytes)
+    # dtype.kind avoids the frame copy that select_dtypes builds
+    numeric_cols = [] if df is None else [col for col, dtype in df.dtypes.items() if dtype.kind in "iufc"]
+    return df, encoding, numeric_cols
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=8)
+def load_csv_preview_cached(file_bytes: bytes, filename: str) -> Tuple[Optional[pd.DataFrame], Optional[str], List[str]]:
+    """Parse only the first PREVIEW_ROWS rows of an uploaded CSV for the upload checks and preview."""
+    df, encoding = _read_csv_fast(file_bytes, nrows=PREVIEW_ROWS)
+    numeric_cols = [] if df is None else [col for col, dtype in df.dtypes.items() if dtype.kind in "iufc"]
+    return df, encoding, numeric_cols
+
+
+@st.cache_resource
+def get_validator() -> ECDataValidator:
+    """Shared validator instance, so the schema is loaded once per process."""
+    return ECDataValidator()
+
+
 def show_post_download_help():
     with st.expander("📦 What to do with your FAIR bundle"):
         st.markdown(
@@ -84,8 +225,8 @@ def main():
     # Initialise components
     ui = UIComponents()
     metadata_gen = FAIRMetadataGenerator()
-    validator = ECDataValidator()
-    emmo_integration = EMMOElectrochemistryIntegration()
+    validator = get_validator()
+    emmo_integration = get_emmo_integration()
 
     # Render header
     ui.render_header()
@@ -127,6 +268,10 @@ def main():
         st.session_state.metadata = None
     if "validation_results" not in st.session_state:
         st.session_state.validation_results = None
+    if "meta_view" not in st.session_state:
+        st.session_state.meta_view = None
+    if "yaml_str" not in st.session_state:
+        st.session_state.yaml_str = None
 
     # Tab 1: Data Upload
     with tab1:
@@ -134,35 +279,25 @@ def main():
 
         if uploaded_file:
             st.session_state.uploaded_file = uploaded_file
+            uf_name, uf_size, uf_type = uploaded_file.name, uploaded_file.size, uploaded_file.type
+            uf_size_kb = uf_size / 1024.0
 
             try:
                 # Validate file type
-                if not uploaded_file.name.lower().endswith(".csv"):
+                if not uf_name.lower().endswith(".csv"):
                     st.error("❌ Please upload a CSV file.")
                     st.info("💡 Tip: Save your data as CSV format from Excel or other software.")
                     return
 
-                # Try to read the file with different encodings if needed
-                df = None
-                encodings_to_try = ["utf-8", "latin1", "cp1252", "iso-8859-1"]
-
-                for encoding in encodings_to_try:
-                    try:
-                        uploaded_file.seek(0)  # Reset file pointer
-                        df = pd.read_csv(uploaded_file, encoding=encoding)
-                        st.success(f"✅ File loaded successfully (encoding: {encoding})")
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                    except Exception as e:
-                        if encoding == encodings_to_try[-1]:  # Last encoding attempt
-                            raise e
-                        continue
+                # The full parse is deferred until metadata generation needs it
+                df, encoding, numeric_cols = load_csv_preview_cached(uploaded_file.getvalue(), uf_name)
 
                 if df is None:
                     st.error("❌ Could not read the file. Please check the file format.")
                     return
 
+                st.success(f"✅ File loaded successfully (encoding: {encoding})")
+
                 # Basic data validation
                 if df.empty:
                     st.warning("⚠️ The uploaded file appears to be empty.")
@@ -170,7 +305,6 @@ def main():
                     return
 
                 # Check for at least some numeric data
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
                 if len(numeric_cols) == 0:
                     st.warning("⚠️ No numeric columns detected in your data.")
                     st.info("Make sure your measurement data (potential, current, etc.) are in numeric format.")
@@ -178,12 +312,12 @@ def main():
                 else:
                     st.success(f"✅ Found {len(numeric_cols)} numeric columns for analysis")
 
-                # Store dataframe in session state
-                st.session_state.df = df
+                # Store the preview in session state
+                st.session_state.df_preview = df
 
                 # Show data preview with error handling
                 try:
-                    ui.render_data_preview(df, "CV")  # Default to CV for preview
+                    ui.render_data_preview(df, DEFAULT_PREVIEW_TECHNIQUE, file_size=uf_size, row_limit=PREVIEW_ROWS)
                 except Exception as plot_error:
                     st.warning(f"⚠️ Preview generation issue: {str(plot_error)}")
                     st.info("Don't worry - you can still proceed with metadata generation!")
@@ -192,11 +326,11 @@ def main():
                     with st.expander("📋 Basic Data Information"):
                         col1, col2 = st.columns(2)
                         with col1:
-                            st.write(f"**Rows:** {len(df)}")
+                            st.write(f"**Rows (preview):** {len(df)}")
                             st.write(f"**Columns:** {len(df.columns)}")
                         with col2:
                             st.write(f"**Numeric columns:** {len(numeric_cols)}")
-                            st.write(f"**File size:** {uploaded_file.size / 1024:.1f} KB")
+                            st.write(f"**File size:** {uf_size_kb:.1f} KB")
 
                         st.write("**Column names:**", list(df.columns))
                         st.dataframe(df.head())
@@ -227,9 +361,9 @@ def main():
                     st.write(
                         "**File info:**",
                         {
-                            "name": uploaded_file.name,
-                            "size": uploaded_file.size,
-                            "type": uploaded_file.type,
+                            "name": uf_name,
+                            "size": uf_size,
+                            "type": uf_type,
                         },
                     )
 
@@ -246,10 +380,15 @@ def main():
         # Technique selection
         technique, description = ui.render_technique_selector()
 
-        # Update data preview with correct technique
-        if "df" in st.session_state:
+        # Update data preview with correct technique; the upload tab already shows the default one
+        if "df_preview" in st.session_state and technique != DEFAULT_PREVIEW_TECHNIQUE:
             with st.expander("📊 Updated Data Preview"):
-                ui.render_data_preview(st.session_state.df, technique)
+                ui.render_data_preview(
+                    st.session_state.df_preview,
+                    technique,
+                    file_size=st.session_state.uploaded_file.size,
+                    row_limit=PREVIEW_ROWS,
+                )
 
         # Technique parameters
         technique_parameters = ui.render_technique_parameters(technique)
@@ -304,10 +443,24 @@ def main():
                     st.info("Proceeding with basic metadata (EMMO features may be limited)")
 
                 st.session_state.metadata = metadata
+                st.session_state.meta_view = build_metadata_view(metadata)
+                st.session_state.yaml_str = metadata_gen.generate_yaml(metadata)
+
+                # Column checks need every row, so parse the whole file now; a malformed row past
+                # the upload preview only surfaces here and must be reported, not hidden
+                df, parse_error = None, None
+                try:
+                    df, _, _ = load_csv_cached(st.session_state.uploaded_file.getvalue(), st.session_state.uploaded_file.name)
+                except Exception as e:
+                    parse_error = str(e)
+                    st.error(f"❌ Could not parse the full data file: {parse_error}")
+                    st.info("Metadata is validated without the data checks. Please fix the file and upload it again.")
 
                 # Comprehensive validation
                 try:
-                    validation_results = validator.validate_metadata(metadata)
+                    validation_results = validator.validate_metadata(metadata, df=df)
+                    if parse_error:
+                        validation_results["errors"].insert(0, f"Data file could not be parsed: {parse_error}")
 
                     # Add EMMO validation if available
                     try:
@@ -342,8 +495,6 @@ def main():
                     st.write("**Error details:**", str(e))
                     st.write("**Technique:**", technique)
                     st.write("**Parameters:**", technique_parameters)
-                    import traceback
-
                     st.code(traceback.format_exc())
 
     # Tab 3: Export and Preview
@@ -358,19 +509,28 @@ def main():
         if st.session_state.validation_results:
             ui.render_validation_results(st.session_state.validation_results)
 
+        meta_view = st.session_state.meta_view
+
         # Metadata preview
         col1, col2 = st.columns([1, 1])
 
         with col1:
             st.subheader("📄 YAML Metadata")
-            yaml_str = metadata_gen.generate_yaml(st.session_state.metadata)
-            st.code(yaml_str, language="yaml")
+            yaml_str = st.session_state.yaml_str
+            # Highlighting very long YAML stalls the browser, so show the head and keep the rest behind an expander
+            yaml_head = yaml_str.split("\n", YAML_PREVIEW_LINES)
+            if len(yaml_head) > YAML_PREVIEW_LINES and yaml_head[-1]:
+                st.code("\n".join(yaml_head[:YAML_PREVIEW_LINES]), language="yaml")
+                with st.expander("Show full YAML"):
+                    st.code(yaml_str, language="yaml")
+            else:
+                st.code(yaml_str, language="yaml")
 
             # Download YAML button
             st.download_button(
                 label="📄 Download Metadata (YAML)",
                 data=yaml_str,
-                file_name=f"metadata_{technique.lower()}.yaml",
+                file_name=meta_view["yaml_filename"],
                 mime="text/yaml",
             )
 
@@ -378,23 +538,19 @@ def main():
             st.subheader("🔍 Metadata Summary")
 
             # Display key information
-            metadata = st.session_state.metadata
-
             st.write("**Experiment Overview:**")
-            st.write(f"• Technique: {metadata.get('technique', {}).get('name', 'N/A')}")
-            st.write(f"• Created: {metadata.get('created_date', 'N/A')[:10]}")
-            st.write(f"• ID: {metadata.get('experiment_id', 'N/A')[:8]}...")
+            st.write(f"• Technique: {meta_view['technique_name']}")
+            st.write(f"• Created: {meta_view['created_date']}")
+            st.write(f"• ID: {meta_view['experiment_id'][:8]}...")
 
-            exp_setup = metadata.get("experimental_setup", {})
             st.write("**Experimental Setup:**")
-            st.write(f"• Working Electrode: {exp_setup.get('working_electrode', 'N/A')}")
-            st.write(f"• Electrolyte: {exp_setup.get('electrolyte', 'N/A')}")
+            st.write(f"• Working Electrode: {meta_view['working_electrode']}")
+            st.write(f"• Electrolyte: {meta_view['electrolyte']}")
 
-            attribution = metadata.get("attribution", {})
-            if attribution.get("creator"):
+            if meta_view["creator"]:
                 st.write("**Attribution:**")
-                st.write(f"• Creator: {attribution.get('creator', 'N/A')}")
-                st.write(f"• Institution: {attribution.get('institution', 'N/A')}")
+                st.write(f"• Creator: {meta_view['creator']}")
+                st.write(f"• Institution: {meta_view['institution']}")
 
         # FAIR Bundle Export
         st.markdown("---")
@@ -412,24 +568,20 @@ def main():
             if st.button("📦 Create FAIR Bundle", type="primary"):
                 try:
                     with st.spinner("Creating FAIR bundle..."):
-                        # Create ZIP bundle
-                        zip_buffer = create_fair_bundle(
+                        # Create ZIP bundle; large bundles are written to a temporary file, not held in memory
+                        with create_fair_bundle(
                             st.session_state.uploaded_file,
                             yaml_str,
                             st.session_state.metadata,
-                        )
+                        ) as zip_buffer:
+                            bundle_bytes = zip_buffer.read()
 
                         st.success("✅ FAIR bundle created successfully!")
 
-                    # Generate filename with technique and experiment ID
-                    technique_name = st.session_state.metadata.get("technique", {}).get("name", "unknown")
-                    exp_id = st.session_state.metadata.get("experiment_id", "unknown")[:8]
-                    filename = f"fair_bundle_{technique_name.lower()}_{exp_id}.zip"
-
                     st.download_button(
                         label="⬇️ Download FAIR Bundle (.zip)",
-                        data=zip_buffer,
-                        file_name=filename,
+                        data=bundle_bytes,
+                        file_name=meta_view["bundle_filename"],
                         mime="application/zip",
                         help="Download your complete FAIR data package",
                     )
@@ -442,37 +594,72 @@ def main():
                     # Debug information
                     if st.checkbox("Show bundle debug info", key="debug_bundle"):
                         st.write("**Error details:**", str(e))
-                        import traceback
-
                         st.code(traceback.format_exc())
 
     # Update progress sidebar
     update_progress_sidebar(progress_container)
 
 
-def create_fair_bundle(uploaded_file, yaml_str: str, metadata: Dict[str, Any]) -> BytesIO:
-    """Create a ZIP bundle with data and metadata."""
-
-    zip_buffer = BytesIO()
+def flatten_metadata(metadata: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested metadata into a single dict keyed by dotted paths, e.g. "technique.name"."""
+    flat = {}
+    for key, value in metadata.items():
+        if isinstance(value, dict):
+            flat.update(flatten_metadata(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def build_metadata_view(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten the metadata fields shown in the Export tab, computed once per generation."""
+    flat = flatten_metadata(metadata)
+    technique_name = flat.get("technique.name")
+    experiment_id = flat.get("experiment_id")
+    file_stem = (technique_name or "unknown").lower()
+
+    return {
+        "technique_name": technique_name or "N/A",
+        "created_date": flat.get("created_date", "N/A")[:10],
+        "experiment_id": experiment_id or "N/A",
+        "working_electrode": flat.get("experimental_setup.working_electrode", "N/A"),
+        "electrolyte": flat.get("experimental_setup.electrolyte", "N/A"),
+        "creator": flat.get("attribution.creator", ""),
+        "institution": flat.get("attribution.institution", "N/A"),
+        "yaml_filename": f"metadata_{file_stem}.yaml",
+        "bundle_filename": f"fair_bundle_{file_stem}_{(experiment_id or 'unknown')[:8]}.zip",
+    }
+
+
+def create_fair_bundle(uploaded_file, yaml_str: str, metadata: Dict[str, Any]) -> BinaryIO:
+    """Create a ZIP bundle with data and metadata, spooled to disk once it outgrows BUNDLE_SPOOL_BYTES."""
+
+    zip_buffer = tempfile.SpooledTemporaryFile(max_size=BUNDLE_SPOOL_BYTES)
     try:
         # Create README content
-        readme_content = generate_readme(metadata)
+        metadata_key = metadata_cache_key(metadata)
+        flat = flatten_metadata(metadata)
+        readme_content = cached_readme(metadata_key, flat)
 
         # Create citation content
-        citation_content = generate_citation(metadata)
+        citation_content = cached_citation(metadata_key, flat)
 
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            # Add original data file to data/ folder
+        # Large uploads get the fastest DEFLATE level; small ones can afford the default
+        compresslevel = 1 if uploaded_file.size > FAST_DEFLATE_BYTES else 6
+
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zip_file:
+            # Add original data file to data/ folder, streamed in 1 MiB chunks
             try:
                 uploaded_file.seek(0)  # Reset file pointer
-                zip_file.writestr(f"data/{uploaded_file.name}", uploaded_file.getvalue())
+                with zip_file.open(f"data/{uploaded_file.name}", "w", force_zip64=True) as data_entry:
+                    shutil.copyfileobj(uploaded_file, data_entry, length=1024 * 1024)
             except Exception as e:
                 st.warning(f"Issue adding data file to bundle: {str(e)}")
                 zip_file.writestr("data/data_file_error.txt", f"Original file could not be added: {str(e)}")
 
             # Add metadata to metadata/ folder
             try:
-                zip_file.writestr("metadata/metadata.yaml", yaml_str)
+                zip_file.writestr("metadata/metadata.yaml", yaml_str, compress_type=zipfile.ZIP_STORED)
             except Exception as e:
                 st.warning(f"Issue adding metadata: {str(e)}")
                 basic_metadata = f"# Metadata generation error\nError: {str(e)}\nTechnique: {metadata.get('technique', {}).get('name', 'Unknown')}"
@@ -480,7 +667,7 @@ def create_fair_bundle(uploaded_file, yaml_str: str, metadata: Dict[str, Any]) -
 
             # Add citation to metadata/ folder
             try:
-                zip_file.writestr("metadata/CITATION.cff", citation_content)
+                zip_file.writestr("metadata/CITATION.cff", citation_content, compress_type=zipfile.ZIP_STORED)
             except Exception as e:
                 st.warning(f"Issue adding citation: {str(e)}")
                 basic_citation = f"# Citation information could not be generated\n# Error: {str(e)}"
@@ -488,7 +675,7 @@ def create_fair_bundle(uploaded_file, yaml_str: str, metadata: Dict[str, Any]) -
 
             # Add README to documentation/ folder
             try:
-                zip_file.writestr("documentation/README.md", readme_content)
+                zip_file.writestr("documentation/README.md", readme_content, compress_type=zipfile.ZIP_STORED)
             except Exception as e:
                 st.warning(f"Issue adding README: {str(e)}")
                 basic_readme = "# EChem FAIR Bundle\n\nThis bundle was generated by EChem FAIRifier.\nSome documentation could not be generated due to errors."
@@ -497,6 +684,8 @@ def create_fair_bundle(uploaded_file, yaml_str: str, metadata: Dict[str, Any]) -
     except Exception as e:
         st.error(f"Critical error creating ZIP file: {str(e)}")
         # Create minimal ZIP with error information
+        zip_buffer.seek(0)
+        zip_buffer.truncate()
         with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
             error_info = f"Bundle creation failed: {str(e)}\nPlease contact support or try again."
             zip_file.writestr("ERROR.txt", error_info)
@@ -505,13 +694,13 @@ def create_fair_bundle(uploaded_file, yaml_str: str, metadata: Dict[str, Any]) -
     return zip_buffer
 
 
-def generate_readme(metadata: Dict[str, Any]) -> str:
-    """Generate README content for the FAIR bundle."""
+def generate_readme(flat: Dict[str, Any]) -> str:
+    """Generate README content for the FAIR bundle from flattened metadata."""
 
     try:
-        technique_name = metadata.get("technique", {}).get("name", "Unknown")
-        created_date = metadata.get("created_date", "Unknown")[:10]
-        exp_id = metadata.get("experiment_id", "N/A")
+        technique_name = flat.get("technique.name", "Unknown")
+        created_date = flat.get("created_date", "Unknown")[:10]
+        exp_id = flat.get("experiment_id", "N/A")
 
         readme = f"""# Electrochemical Data Bundle
 
@@ -523,7 +712,7 @@ This bundle contains FAIR-compliant electrochemical data generated using EChem F
 **ID:** {exp_id}
 
 ## Files Included
-- `{metadata.get('dataset', {}).get('filename', 'data.csv')}` - Raw experimental data
+- `{flat.get('dataset.filename', 'data.csv')}` - Raw experimental data
 - `metadata.yaml` - FAIR metadata following EChem-FAIR schema
 - `CITATION.cff` - Citation information in Citation File Format
 
@@ -538,7 +727,7 @@ This data follows FAIR principles:
 Please see CITATION.cff for proper attribution.
 
 ## License
-{metadata.get('fair_compliance', {}).get('reusable', {}).get('license', 'Please check metadata for licensing information')}
+{flat.get('fair_compliance.reusable.license', 'Please check metadata for licensing information')}
 
 ---
 Generated by EChem FAIRifier v1.0
@@ -559,23 +748,17 @@ Generated by EChem FAIRifier v1.0
     return readme
 
 
-def generate_citation(metadata: Dict[str, Any]) -> str:
-    """Generate Citation File Format content."""
+def generate_citation(flat: Dict[str, Any]) -> str:
+    """Generate Citation File Format content from flattened metadata."""
 
     try:
-        attribution = metadata.get("attribution", {})
-        technique_name = metadata.get("technique", {}).get("name", "Electrochemical")
+        technique_name = flat.get("technique.name", "Electrochemical")
 
         # Handle name splitting safely
-        creator_name = attribution.get("creator", "Unknown")
+        creator_name = flat.get("attribution.creator", "Unknown")
         if creator_name and creator_name != "Unknown":
-            name_parts = creator_name.strip().split()
-            if len(name_parts) >= 2:
-                family_name = name_parts[-1]
-                given_names = " ".join(name_parts[:-1])
-            else:
-                family_name = creator_name
-                given_names = ""
+            # Collapse runs of whitespace (including tabs) so only the last word is the family name
+            given_names, _, family_name = " ".join(creator_name.split()).rpartition(" ")
         else:
             family_name = "Unknown"
             given_names = ""
@@ -587,10 +770,10 @@ title: "{technique_name} measurement data"
 authors:
 - family-names: "{family_name}"
   given-names: "{given_names}"
-  orcid: "{attribution.get('orcid', '')}"
-  affiliation: "{attribution.get('institution', '')}"
-date-released: "{metadata.get('created_date', '')[:10]}"
-license: "{metadata.get('fair_compliance', {}).get('reusable', {}).get('license', 'Unknown')}"
+  orcid: "{flat.get('attribution.orcid', '')}"
+  affiliation: "{flat.get('attribution.institution', '')}"
+date-released: "{flat.get('created_date', '')[:10]}"
+license: "{flat.get('fair_compliance.reusable.license', 'Unknown')}"
 repository-code: "https://github.com/haghighatbin/echem-fairifier"
 """
     except Exception as e:
@@ -605,6 +788,31 @@ title: "Electrochemical measurement data"
     return cff_content
 
 
+def metadata_cache_key(metadata: Dict[str, Any]) -> str:
+    """Stable digest of the metadata, used to key the cached renderings below."""
+    if orjson is not None:
+        payload = orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    else:
+        payload = json.dumps(metadata, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Metadata only changes on "Generate Metadata", so serialise each version once.
+# The flattened dict is passed unhashed; metadata_key identifies it. Every
+# generation carries a fresh experiment_id/created_date (both rendered below),
+# so keep only the last few versions.
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=8)
+def cached_readme(metadata_key: str, _flat: Dict[str, Any]) -> str:
+    """Cached README content for the FAIR bundle."""
+    return generate_readme(_flat)
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=8)
+def cached_citation(metadata_key: str, _flat: Dict[str, Any]) -> str:
+    """Cached Citation File Format content."""
+    return generate_citation(_flat)
+
+
 def update_progress_sidebar(container):
     """Update the progress tracking in sidebar."""
 
@@ -616,19 +824,15 @@ def update_progress_sidebar(container):
             ("📦 Export Bundle", False),  # This is always the final step
         ]
 
-        for step_name, completed in steps:
-            if completed:
-                st.success(f"✅ {step_name}")
-            else:
-                st.info(f"⏳ {step_name}")
+        # One markdown block instead of a widget per step; trailing spaces force line breaks
+        st.markdown("  \n".join(f"{'✅' if completed else '⏳'} {step_name}" for step_name, completed in steps))
 
         # Show completion percentage
         completed_steps = sum(1 for _, completed in steps[:-1] if completed)
         total_steps = len(steps) - 1
         progress = completed_steps / total_steps if total_steps > 0 else 0
 
-        st.progress(progress)
-        st.write(f"Progress: {completed_steps}/{total_steps} steps completed")
+        st.progress(progress, text=f"Progress: {completed_steps}/{total_steps} steps completed")
 
 
 if __name__ == "__main__":
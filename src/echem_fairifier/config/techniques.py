@@ -2,11 +2,16 @@
 Electrochemical technique definitions and parameter templates.
 """
 
-from typing import Dict, Any, List
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+# dataclass(slots=...) needs Python 3.10; 3.9 keeps a per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class TechniqueParameter:
     """Definition of a technique parameter."""
 
@@ -15,8 +20,8 @@ class TechniqueParameter:
     description: str
     unit: str = ""
     parameter_type: str = "number"  # number, text, list
-    min_value: float = None
-    max_value: float = None
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
 
 
 class ElectrochemicalTechniques:
@@ -193,21 +198,32 @@ class ElectrochemicalTechniques:
         "CA": "Chronoamperometry - Current response to potential steps",
     }
 
+    # Read-only lookups derived once from TECHNIQUE_PARAMETERS
+    _TECHNIQUE_LIST = tuple(TECHNIQUE_PARAMETERS)
+    _DEFAULTS = {
+        technique: MappingProxyType({name: param.default_value for name, param in params.items()})
+        for technique, params in TECHNIQUE_PARAMETERS.items()
+    }
+
+    # Freeze the registry itself once everything above has been derived from it
+    TECHNIQUE_PARAMETERS = MappingProxyType(
+        {technique: MappingProxyType(params) for technique, params in TECHNIQUE_PARAMETERS.items()}
+    )
+
     @classmethod
-    def get_technique_list(cls) -> List[str]:
+    def get_technique_list(cls) -> Tuple[str, ...]:
         """Get list of available techniques."""
-        return list(cls.TECHNIQUE_PARAMETERS.keys())
+        return cls._TECHNIQUE_LIST
 
     @classmethod
     def get_technique_parameters(cls, technique: str) -> Dict[str, TechniqueParameter]:
         """Get parameters for a specific technique."""
-        return cls.TECHNIQUE_PARAMETERS.get(technique, {})
+        return dict(cls.TECHNIQUE_PARAMETERS.get(technique, {}))
 
     @classmethod
     def get_default_values(cls, technique: str) -> Dict[str, Any]:
         """Get default parameter values for a technique."""
-        params = cls.get_technique_parameters(technique)
-        return {name: param.default_value for name, param in params.items()}
+        return dict(cls._DEFAULTS.get(technique, {}))
 
     @classmethod
     def get_technique_description(cls, technique: str) -> str:
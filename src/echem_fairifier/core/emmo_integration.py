@@ -5,25 +5,144 @@ Provides controlled vocabularies and term validation.
 
 import streamlit as st
 import logging
-from typing import Dict, List, Optional
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 from dataclasses import dataclass
 
+# dataclass(slots=...) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
 
-@dataclass
+
+def _normalise_name(name: str) -> str:
+    """Normalise a term name for lookups: trimmed, upper-cased, spaces as underscores."""
+    return name.strip().upper().replace(" ", "_")
+
+
+# Keywords matched against the word tokens of term labels and definitions
+CATEGORY_FILTERS = {
+    "techniques": frozenset({"voltammetry", "spectroscopy", "chronoamperometry"}),
+    "electrodes": frozenset({"electrode"}),
+    "materials": frozenset({"carbon", "platinum", "gold", "silver"}),
+    "electrolytes": frozenset({"nitrate", "chloride", "sulfate"}),
+}
+
+
+# Report sections in display order: (validation result key, heading)
+_REPORT_SECTIONS = (
+    ("valid_terms", "## ✅ Validated Terms\n"),
+    ("suggestions", "## 💡 Vocabulary Suggestions\n"),
+    ("warnings", "## ⚠️ Recommendations\n"),
+)
+_REPORT_FOOTER_TEMPLATE = (
+    "## 📚 About EMMO\n"
+    "The Elementary Multiperspective Material Ontology (EMMO) provides "
+    "standardised vocabulary for materials science and electrochemistry. "
+    "Using EMMO terms improves data interoperability and FAIR compliance.\n\n"
+    "Ontology URL: {url}\n"
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class EMMOTerm:
     """Represents an EMMO ontology term."""
 
     iri: str
     label: str
     definition: str
-    synonyms: List[str] = None
-    parent_classes: List[str] = None
-
-    def __post_init__(self):
-        if self.synonyms is None:
-            self.synonyms = []
-        if self.parent_classes is None:
-            self.parent_classes = []
+    synonyms: Tuple[str, ...] = ()
+    parent_classes: Tuple[str, ...] = ()
+
+
+# Pre-defined EMMO electrochemistry terms for offline validation:
+# (key, iri, label, definition, synonyms)
+_TERM_ROWS: Tuple[Tuple[str, str, str, str, Tuple[str, ...]], ...] = (
+    # Key electrochemical technique terms from EMMO electrochemistry domain
+    (
+        "cyclic_voltammetry",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_25aae0e9_a17c_4eb6_ac69_dd4264fad3d5",
+        "CyclicVoltammetry",
+        "A voltammetry technique where the potential swept linearly between two limits at a constant rate.",
+        ("CV", "cyclic voltammetry"),
+    ),
+    (
+        "differential_pulse_voltammetry",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_f49b84d4_e1f9_424c_bb22_8cea23c0a7d4",
+        "DifferentialPulseVoltammetry",
+        "A voltammetry technique where pulses of potential are applied on top of a linear sweep.",
+        ("DPV", "differential pulse voltammetry"),
+    ),
+    (
+        "square_wave_voltammetry",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_979e24bc_a0d6_4a94_ad99_46739c887dc1",
+        "SquareWaveVoltammetry",
+        "A voltammetry technique where a square wave potential is superimposed on a staircase waveform.",
+        ("SWV", "square wave voltammetry"),
+    ),
+    (
+        "electrochemical_impedance_spectroscopy",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_c7c8cda4_b8a4_4b1a_b0eb_58cbb1516945",
+        "ElectrochemicalImpedanceSpectroscopy",
+        "A technique that applies a small amplitude sinusoidal voltage perturbation to measure impedance.",
+        ("EIS", "impedance spectroscopy"),
+    ),
+    (
+        "chronoamperometry",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_f57e2b9c_bc4c_4245_b154_7ee83e688464",
+        "Chronoamperometry",
+        "A technique where potential steps are applied and current response is measured vs time.",
+        ("CA", "chronoamperometry"),
+    ),
+    # Electrode terms
+    (
+        "working_electrode",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_fb0d9eef_92af_4628_8814_e065ca255d59",
+        "WorkingElectrode",
+        "The electrode at which the electrochemical reaction of interest occurs.",
+        ("WE", "working electrode"),
+    ),
+    (
+        "reference_electrode",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_8e3bd7c7_681b_4f50_8ac5_f3dad6312ff4",
+        "ReferenceElectrode",
+        "An electrode with a stable and well-known electrode potential.",
+        ("RE", "reference electrode"),
+    ),
+    (
+        "counter_electrode",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_4bd89acc_d5ee_4dae_8bb0_bf9e5de43fbd",
+        "CounterElectrode",
+        "An electrode used to complete the electrical circuit in an electrochemical cell.",
+        ("CE", "auxiliary electrode", "counter electrode"),
+    ),
+    # Material terms
+    (
+        "glassy_carbon",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_3f70e5de_fa27_46a4_b201_92d0e6b5ab7a",
+        "GlassyCarbon",
+        "A non-graphitising carbon with a glass-like structure.",
+        ("GC", "vitreous carbon"),
+    ),
+    (
+        "platinum",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_1b827d8b_47e4_4f5a_a49e_4ad3fb28d559",
+        "Platinum",
+        "A precious metal electrode material with high chemical stability.",
+        ("Pt", "platinum"),
+    ),
+    # Electrolyte components
+    (
+        "potassium_nitrate",
+        "https://w3id.org/emmo/domain/electrochemistry#electrochemistry_5e8b6d8c_3d60_4186_8b47_0c80b154b0a9",
+        "PotassiumNitrate",
+        "An ionic compound with formula KNO3, commonly used as supporting electrolyte.",
+        ("KNO3", "potassium nitrate"),
+    ),
+)
 
 
 class EMMOElectrochemistryIntegration:
@@ -32,88 +151,101 @@ class EMMOElectrochemistryIntegration:
     def __init__(self):
         self.ontology_url = "https://w3id.org/emmo/domain/electrochemistry"
         self.local_terms = self._load_local_terms()
-        self.validation_cache = {}
+        self._synonym_index = self._build_synonym_index()
+        self._term_rank = {key: rank for rank, key in enumerate(self.local_terms)}
+        self._prefix_trie = self._build_prefix_trie()
+        self._definition_index = self._build_definition_index()
+        self._category_index = self._build_category_index()
+        # Bounded per instance; the same electrode descriptions recur on every rerun
+        self._match_keys_cached = lru_cache(maxsize=1024)(self._match_keys)
 
         # Set up logging
         self.logger = logging.getLogger(__name__)
 
     def _load_local_terms(self) -> Dict[str, EMMOTerm]:
-        """Load pre-defined EMMO electrochemistry terms for offline validation."""
-
-        # Key electrochemical technique terms from EMMO electrochemistry domain
-        terms = {
-            "cyclic_voltammetry": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_25aae0e9_a17c_4eb6_ac69_dd4264fad3d5",
-                label="CyclicVoltammetry",
-                definition="A voltammetry technique where the potential swept linearly between two limits at a constant rate.",
-                synonyms=["CV", "cyclic voltammetry"],
-            ),
-            "differential_pulse_voltammetry": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_f49b84d4_e1f9_424c_bb22_8cea23c0a7d4",
-                label="DifferentialPulseVoltammetry",
-                definition="A voltammetry technique where pulses of potential are applied on top of a linear sweep.",
-                synonyms=["DPV", "differential pulse voltammetry"],
-            ),
-            "square_wave_voltammetry": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_979e24bc_a0d6_4a94_ad99_46739c887dc1",
-                label="SquareWaveVoltammetry",
-                definition="A voltammetry technique where a square wave potential is superimposed on a staircase waveform.",
-                synonyms=["SWV", "square wave voltammetry"],
-            ),
-            "electrochemical_impedance_spectroscopy": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_c7c8cda4_b8a4_4b1a_b0eb_58cbb1516945",
-                label="ElectrochemicalImpedanceSpectroscopy",
-                definition="A technique that applies a small amplitude sinusoidal voltage perturbation to measure impedance.",
-                synonyms=["EIS", "impedance spectroscopy"],
-            ),
-            "chronoamperometry": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_f57e2b9c_bc4c_4245_b154_7ee83e688464",
-                label="Chronoamperometry",
-                definition="A technique where potential steps are applied and current response is measured vs time.",
-                synonyms=["CA", "chronoamperometry"],
-            ),
-            # Electrode terms
-            "working_electrode": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_fb0d9eef_92af_4628_8814_e065ca255d59",
-                label="WorkingElectrode",
-                definition="The electrode at which the electrochemical reaction of interest occurs.",
-                synonyms=["WE", "working electrode"],
-            ),
-            "reference_electrode": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_8e3bd7c7_681b_4f50_8ac5_f3dad6312ff4",
-                label="ReferenceElectrode",
-                definition="An electrode with a stable and well-known electrode potential.",
-                synonyms=["RE", "reference electrode"],
-            ),
-            "counter_electrode": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_4bd89acc_d5ee_4dae_8bb0_bf9e5de43fbd",
-                label="CounterElectrode",
-                definition="An electrode used to complete the electrical circuit in an electrochemical cell.",
-                synonyms=["CE", "auxiliary electrode", "counter electrode"],
-            ),
-            # Material terms
-            "glassy_carbon": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_3f70e5de_fa27_46a4_b201_92d0e6b5ab7a",
-                label="GlassyCarbon",
-                definition="A non-graphitising carbon with a glass-like structure.",
-                synonyms=["GC", "vitreous carbon"],
-            ),
-            "platinum": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_1b827d8b_47e4_4f5a_a49e_4ad3fb28d559",
-                label="Platinum",
-                definition="A precious metal electrode material with high chemical stability.",
-                synonyms=["Pt", "platinum"],
-            ),
-            # Electrolyte components
-            "potassium_nitrate": EMMOTerm(
-                iri="https://w3id.org/emmo/domain/electrochemistry#electrochemistry_5e8b6d8c_3d60_4186_8b47_0c80b154b0a9",
-                label="PotassiumNitrate",
-                definition="An ionic compound with formula KNO3, commonly used as supporting electrolyte.",
-                synonyms=["KNO3", "potassium nitrate"],
-            ),
+        """Build the EMMO terms from the module-level row table."""
+        return {
+            key: EMMOTerm(iri=iri, label=label, definition=definition, synonyms=synonyms)
+            for key, iri, label, definition, synonyms in _TERM_ROWS
         }
 
-        return terms
+    def _build_synonym_index(self) -> Dict[str, EMMOTerm]:
+        """Map normalised term keys, labels and synonyms to their terms."""
+        index = {_normalise_name(key): term for key, term in self.local_terms.items()}
+        # Canonical keys take precedence over labels and synonyms
+        for term in self.local_terms.values():
+            index.setdefault(_normalise_name(term.label), term)
+            for synonym in term.synonyms:
+                index.setdefault(_normalise_name(synonym), term)
+        return index
+
+    def _build_prefix_trie(self) -> Dict:
+        """
+        Build a character trie over lower-cased labels, synonyms and synonym words.
+
+        Each node maps characters to child nodes and holds, under the ``None`` key,
+        the keys of every term whose names pass through it.
+        """
+        trie = {None: set()}
+        for key, term in self.local_terms.items():
+            names = {term.label.lower()}
+            for synonym in term.synonyms:
+                synonym = synonym.lower()
+                names.add(synonym)
+                names.update(synonym.split())
+
+            for name in names:
+                node = trie
+                node[None].add(key)
+                for char in name:
+                    node = node.setdefault(char, {None: set()})
+                    node[None].add(key)
+        return trie
+
+    def _build_definition_index(self) -> Dict[str, Set[str]]:
+        """Map each lower-cased definition word to the keys of the terms using it."""
+        index = {}
+        for key, term in self.local_terms.items():
+            for word in _WORD_RE.findall(term.definition.lower()):
+                index.setdefault(word, set()).add(key)
+        return index
+
+    def _build_category_index(self) -> Dict[str, Mapping[str, EMMOTerm]]:
+        """Filter the local terms once per category into read-only views."""
+        # CamelCase labels are split so "SquareWaveVoltammetry" yields "voltammetry"
+        term_tokens = {
+            key: frozenset(_WORD_RE.findall(f"{_CAMEL_BOUNDARY_RE.sub(' ', term.label)} {term.definition}".lower()))
+            for key, term in self.local_terms.items()
+        }
+        index = {}
+        for category, keywords in CATEGORY_FILTERS.items():
+            index[category] = MappingProxyType(
+                {key: self.local_terms[key] for key, tokens in term_tokens.items() if keywords & tokens}
+            )
+        return index
+
+    def _prefix_keys(self, prefix: str) -> Set[str]:
+        """Walk the trie for a lower-cased prefix and return the matching term keys."""
+        node = self._prefix_trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+        return node[None]
+
+    def predictive_search(self, prefix: str, limit: int = 5) -> List[EMMOTerm]:
+        """
+        Find terms whose label, synonym or a synonym word starts with a prefix.
+
+        Args:
+            prefix: Start of a term name, matched case-insensitively
+            limit: Maximum number of terms to return
+
+        Returns:
+            Matching EMMOTerm objects in vocabulary order
+        """
+        keys = sorted(self._prefix_keys(prefix.lower()), key=self._term_rank.__getitem__)
+        return [self.local_terms[key] for key in keys[:limit]]
 
     def validate_technique(self, technique: str) -> Optional[EMMOTerm]:
         """
@@ -125,32 +257,10 @@ class EMMOElectrochemistryIntegration:
         Returns:
             EMMOTerm if valid, None otherwise
         """
-        technique_lower = technique.lower().replace(" ", "_")
-
-        # Direct lookup
-        if technique_lower in self.local_terms:
-            return self.local_terms[technique_lower]
-
-        # Synonym lookup
-        for term in self.local_terms.values():
-            if technique.upper() in [syn.upper() for syn in term.synonyms]:
-                return term
-
-        # Fuzzy matching for common variations
-        technique_mappings = {
-            "cv": "cyclic_voltammetry",
-            "dpv": "differential_pulse_voltammetry",
-            "swv": "square_wave_voltammetry",
-            "eis": "electrochemical_impedance_spectroscopy",
-            "ca": "chronoamperometry",
-        }
-
-        if technique.lower() in technique_mappings:
-            return self.local_terms[technique_mappings[technique.lower()]]
-
-        return None
+        # Abbreviations such as "CV" are indexed as synonyms
+        return self._synonym_index.get(_normalise_name(technique))
 
-    def get_controlled_vocabulary(self, category: str) -> Dict[str, EMMOTerm]:
+    def get_controlled_vocabulary(self, category: str) -> Mapping[str, EMMOTerm]:
         """
         Get controlled vocabulary terms for a specific category.
 
@@ -158,26 +268,9 @@ class EMMOElectrochemistryIntegration:
             category: Category like 'techniques', 'electrodes', 'materials'
 
         Returns:
-            Dictionary of relevant terms
+            Read-only mapping of relevant terms (empty for unknown categories)
         """
-        category_filters = {
-            "techniques": ["voltammetry", "spectroscopy", "chronoamperometry"],
-            "electrodes": ["electrode"],
-            "materials": ["carbon", "platinum", "gold", "silver"],
-            "electrolytes": ["nitrate", "chloride", "sulfate"],
-        }
-
-        if category not in category_filters:
-            return {}
-
-        keywords = category_filters[category]
-        filtered_terms = {}
-
-        for key, term in self.local_terms.items():
-            if any(keyword in term.label.lower() or keyword in term.definition.lower() for keyword in keywords):
-                filtered_terms[key] = term
-
-        return filtered_terms
+        return self._category_index.get(category, MappingProxyType({}))
 
     def suggest_terms(self, user_input: str, category: str = None) -> List[EMMOTerm]:
         """
@@ -190,29 +283,21 @@ class EMMOElectrochemistryIntegration:
         Returns:
             List of suggested EMMOTerm objects
         """
-        suggestions = []
-        user_lower = user_input.lower()
-
-        search_terms = self.local_terms
+        # One index walk per input value, shared by every category filter applied to it
+        keys = self._match_keys_cached(user_input.lower())
         if category:
-            search_terms = self.get_controlled_vocabulary(category)
-
-        for term in search_terms.values():
-            # Check label similarity
-            if user_lower in term.label.lower():
-                suggestions.append(term)
-                continue
-
-            # Check synonym similarity
-            if any(user_lower in syn.lower() for syn in term.synonyms):
-                suggestions.append(term)
-                continue
-
-            # Check definition keywords
-            if user_lower in term.definition.lower():
-                suggestions.append(term)
-
-        return suggestions[:5]  # Return top 5 suggestions
+            vocabulary = self.get_controlled_vocabulary(category)
+            keys = [key for key in keys if key in vocabulary]
+        return [self.local_terms[key] for key in keys[:5]]  # Return top 5 suggestions
+
+    def _match_keys(self, user_lower: str) -> Tuple[str, ...]:
+        """Keys of all terms matching lower-cased input, in vocabulary order."""
+        # Label and synonym prefixes, plus definitions containing every word of the input
+        matches = set(self._prefix_keys(user_lower))
+        words = _WORD_RE.findall(user_lower)
+        if words:
+            matches |= set.intersection(*(self._definition_index.get(word, set()) for word in words))
+        return tuple(sorted(matches, key=self._term_rank.__getitem__))
 
     def validate_metadata_terms(self, metadata: Dict) -> Dict[str, List[str]]:
         """
@@ -270,13 +355,14 @@ class EMMOElectrochemistryIntegration:
         Returns:
             Enriched metadata with EMMO terms
         """
-        enriched = metadata.copy()
-
-        # Add EMMO section
-        enriched["emmo_compliance"] = {
-            "ontology_version": "https://w3id.org/emmo/domain/electrochemistry",
-            "terms_used": [],
-            "vocabulary_mapping": {},
+        # Only the branches written below are copied; the caller's nested dicts stay untouched
+        enriched = {
+            **metadata,
+            "emmo_compliance": {
+                "ontology_version": "https://w3id.org/emmo/domain/electrochemistry",
+                "terms_used": [],
+                "vocabulary_mapping": {},
+            },
         }
 
         # Enrich technique information
@@ -284,9 +370,12 @@ class EMMOElectrochemistryIntegration:
         if technique_name:
             emmo_term = self.validate_technique(technique_name)
             if emmo_term:
-                enriched["technique"]["emmo_iri"] = emmo_term.iri
-                enriched["technique"]["emmo_label"] = emmo_term.label
-                enriched["technique"]["emmo_definition"] = emmo_term.definition
+                enriched["technique"] = {
+                    **metadata["technique"],
+                    "emmo_iri": emmo_term.iri,
+                    "emmo_label": emmo_term.label,
+                    "emmo_definition": emmo_term.definition,
+                }
 
                 enriched["emmo_compliance"]["terms_used"].append(
                     {
@@ -301,14 +390,18 @@ class EMMOElectrochemistryIntegration:
         vocabulary_suggestions = {}
 
         for field, value in exp_setup.items():
-            if value and isinstance(value, str):
-                suggestions = self.suggest_terms(value)
-                if suggestions:
-                    vocabulary_suggestions[field] = {
-                        "input_value": value,
-                        "emmo_suggestion": suggestions[0].label,
-                        "emmo_iri": suggestions[0].iri,
-                    }
+            # Blank and single-character values only produce noise matches
+            if not isinstance(value, str) or len(value.strip()) < 2:
+                continue
+            # Only the best match is used, so skip building the suggestion list
+            keys = self._match_keys_cached(value.lower())
+            if keys:
+                best = self.local_terms[keys[0]]
+                vocabulary_suggestions[field] = {
+                    "input_value": value,
+                    "emmo_suggestion": best.label,
+                    "emmo_iri": best.iri,
+                }
 
         if vocabulary_suggestions:
             enriched["emmo_compliance"]["vocabulary_mapping"] = vocabulary_suggestions
@@ -327,41 +420,22 @@ class EMMOElectrochemistryIntegration:
         """
         validation_results = self.validate_metadata_terms(metadata)
 
-        report = "# EMMO Compliance Report\n\n"
-
-        if validation_results["valid_terms"]:
-            report += "## ✅ Validated Terms\n"
-            for term in validation_results["valid_terms"]:
-                report += f"- {term}\n"
-            report += "\n"
-
-        if validation_results["suggestions"]:
-            report += "## 💡 Vocabulary Suggestions\n"
-            for suggestion in validation_results["suggestions"]:
-                report += f"- {suggestion}\n"
-            report += "\n"
-
-        if validation_results["warnings"]:
-            report += "## ⚠️ Recommendations\n"
-            for warning in validation_results["warnings"]:
-                report += f"- {warning}\n"
-            report += "\n"
-
-        report += "## 📚 About EMMO\n"
-        report += "The Elementary Multiperspective Material Ontology (EMMO) provides "
-        report += "standardised vocabulary for materials science and electrochemistry. "
-        report += "Using EMMO terms improves data interoperability and FAIR compliance.\n\n"
-        report += f"Ontology URL: {self.ontology_url}\n"
+        parts = ["# EMMO Compliance Report\n\n"]
+        for key, heading in _REPORT_SECTIONS:
+            if validation_results[key]:
+                parts.append(heading)
+                parts.extend(f"- {item}\n" for item in validation_results[key])
+                parts.append("\n")
+        parts.append(_REPORT_FOOTER_TEMPLATE.format(url=self.ontology_url))
 
-        return report
+        return "".join(parts)
 
 
 # Convenience functions for Streamlit integration
+@st.cache_resource
 def get_emmo_integration() -> EMMOElectrochemistryIntegration:
-    """Get EMMO integration instance (cached)."""
-    if "emmo_integration" not in st.session_state:
-        st.session_state.emmo_integration = EMMOElectrochemistryIntegration()
-    return st.session_state.emmo_integration
+    """Get EMMO integration instance, shared across sessions (read-only term data)."""
+    return EMMOElectrochemistryIntegration()
 
 
 def validate_with_emmo(metadata: Dict) -> Dict[str, List[str]]:
@@ -3,10 +3,25 @@ FAIR metadata generation for electrochemical data.
 """
 
 import yaml
+import numpy as np
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
 import uuid
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
+
+class _YamlDumper(_SafeDumper):
+    """Safe dumper that also accepts read-only mappings and numpy scalars."""
+
+
+_YamlDumper.add_representer(MappingProxyType, lambda dumper, data: dumper.represent_dict(dict(data)))
+_YamlDumper.add_multi_representer(np.generic, lambda dumper, data: dumper.represent_data(data.item()))
+
 
 class FAIRMetadataGenerator:
     """Generate FAIR-compliant metadata for electrochemical experiments."""
@@ -118,6 +133,7 @@ class FAIRMetadataGenerator:
         """Convert metadata dictionary to YAML string."""
         return yaml.dump(
             metadata,
+            Dumper=_YamlDumper,
             default_flow_style=False,
             sort_keys=False,
             indent=2,
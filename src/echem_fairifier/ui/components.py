@@ -4,7 +4,6 @@ Reusable UI components for the EChem FAIRifier Streamlit app.
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from typing import Dict, Any, List, Optional, Tuple
 from ..config.techniques import ElectrochemicalTechniques, TechniqueParameter
@@ -296,34 +295,50 @@ class UIComponents:
         }
 
     @staticmethod
-    def render_data_preview(df: pd.DataFrame, technique: str) -> None:
-        """Render data preview with appropriate plotting."""
+    def render_data_preview(
+        df: pd.DataFrame, technique: str, file_size: Optional[int] = None, row_limit: Optional[int] = None
+    ) -> None:
+        """
+        Render data preview with appropriate plotting.
+
+        Args:
+            df: Data to preview, possibly only the first rows of the file
+            technique: Technique whose plot layout is used
+            file_size: Size of the uploaded file in bytes, if known
+            row_limit: Row cap the preview was read with; reaching it means the file has more rows
+        """
         st.subheader("📊 Data Preview")
 
         # Show basic data info
         with st.expander("📋 Dataset Information"):
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Rows", len(df))
+                if row_limit is not None and len(df) >= row_limit:
+                    st.metric("Rows", f"{len(df)}+", help=f"Only the first {row_limit} rows are loaded for the preview")
+                else:
+                    st.metric("Rows", len(df))
             with col2:
                 st.metric("Columns", len(df.columns))
             with col3:
-                st.metric("File Size", f"{df.memory_usage(deep=True).sum() / 1024:.1f} KB")
+                if file_size is not None:
+                    st.metric("File Size", f"{file_size / 1024:.1f} KB")
+                else:
+                    st.metric("Preview Size", f"{df.memory_usage(deep=True).sum() / 1024:.1f} KB")
 
             st.write("**Columns found:**", list(df.columns))
 
         # Generate appropriate plot
         try:
-            fig = UIComponents._create_technique_plot(df, technique)
+            df_hash = int(pd.util.hash_pandas_object(df).sum())
+            fig, fallback_fig = _build_preview_figs(df_hash, tuple(df.columns), technique, df)
             if fig:
                 st.plotly_chart(
                     fig,
                     use_container_width=True,
-                    key=f"plot_{technique}_{hash(str(df.columns))}",
+                    key=f"plot_{technique}_{hash(tuple(df.columns))}",
                 )
             else:
                 # Show fallback plot if technique-specific plot fails
-                fallback_fig = UIComponents._create_fallback_plot(df)
                 if fallback_fig:
                     st.plotly_chart(fallback_fig, use_container_width=True)
                     st.info("💡 Using generic plot - column names don't match expected patterns for " + technique)
@@ -349,6 +364,9 @@ class UIComponents:
         if df.empty:
             return None
 
+        # plotly.express is slow to import; defer it until a plot is actually built
+        import plotly.express as px
+
         try:
             # Find columns using flexible pattern matching
             columns = UIComponents._find_data_columns(df, technique)
@@ -496,6 +514,8 @@ class UIComponents:
     @staticmethod
     def _create_fallback_plot(df: pd.DataFrame) -> Optional[go.Figure]:
         """Create a generic plot when technique-specific plotting fails."""
+        import plotly.express as px
+
         try:
             # Find the first two numeric columns
             numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
@@ -568,3 +588,14 @@ class UIComponents:
             st.markdown('<div class="success-box">', unsafe_allow_html=True)
             st.success("✅ **Metadata validation passed!** Your data meets FAIR standards.")
             st.markdown("</div>", unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=8)
+def _build_preview_figs(
+    df_hash: int, columns: Tuple[str, ...], technique: str, _df: pd.DataFrame
+) -> Tuple[Optional[go.Figure], Optional[go.Figure]]:
+    """Build the technique plot, or the fallback plot, once per data and technique."""
+    fig = UIComponents._create_technique_plot(_df, technique)
+    if fig:
+        return fig, None
+    return None, UIComponents._create_fallback_plot(_df)
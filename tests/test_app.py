@@ -0,0 +1,146 @@
+"""
+Tests for the Streamlit app's file-handling helpers.
+"""
+
+import pytest
+import pandas as pd
+import codecs
+import sys
+from io import BytesIO
+from pathlib import Path
+
+# Add src to path for testing
+src_dir = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_dir))
+
+from echem_fairifier import app
+from echem_fairifier.app import _read_csv_arrow, _read_csv_fast, detect_encoding, generate_citation
+
+
+class TestEncodingDetection:
+    """Test suite for upload encoding detection."""
+
+    @pytest.mark.parametrize(
+        "bom, expected",
+        [(codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16")],
+    )
+    def test_bom(self, bom, expected):
+        """Test that a byte order mark decides the encoding."""
+        assert detect_encoding(bom + "Potential (V)".encode("latin-1")) == expected
+
+    def test_plain_utf8(self):
+        """Test UTF-8 text without a BOM."""
+        assert detect_encoding("Potential (V),Current (µA)\n".encode("utf-8")) == "utf-8"
+
+    @pytest.mark.parametrize("cut", [1, 2, 3])
+    def test_multibyte_char_at_sample_boundary(self, cut):
+        """Test that a character split by the sample boundary is not taken for latin-1."""
+        data = b"a" * (1024 - cut) + "😀".encode("utf-8") + b"\n"
+
+        assert detect_encoding(data, sample_size=1024) == "utf-8"
+
+    def test_invalid_byte_at_sample_boundary(self, monkeypatch):
+        """Test that an invalid byte near the boundary is still rejected as UTF-8."""
+        monkeypatch.setattr(app, "from_bytes", None)
+        data = b"a" * 1022 + b"\xb5" + b"a" * 100
+
+        assert detect_encoding(data, sample_size=1024) == "latin-1"
+
+    def test_legacy_encoding_detected(self):
+        """Test that charset_normalizer picks a legacy single-byte encoding."""
+        pytest.importorskip("charset_normalizer")
+        data = "Potential (V),Current (µA),Température (°C)\n".encode("cp1252") * 20
+
+        assert detect_encoding(data) in ("cp1252", "latin_1", "iso8859_15")
+
+    def test_fallback_without_charset_normalizer(self, monkeypatch):
+        """Test the latin-1 fallback when charset_normalizer is unavailable."""
+        monkeypatch.setattr(app, "from_bytes", None)
+
+        assert detect_encoding("Current (µA)".encode("latin-1")) == "latin-1"
+
+    def test_fallback_without_match(self, monkeypatch):
+        """Test the latin-1 fallback when charset_normalizer finds no match."""
+
+        class _NoMatch:
+            def best(self):
+                return None
+
+        monkeypatch.setattr(app, "from_bytes", lambda *args, **kwargs: _NoMatch())
+
+        assert detect_encoding("Current (µA)".encode("latin-1")) == "latin-1"
+
+
+class TestCSVReading:
+    """Test suite for the pyarrow/pandas CSV read paths."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        pytest.importorskip("pyarrow")
+
+        rows = [f"{-0.2 + i * 0.01:.2f},{i * 1e-6:.6e}" for i in range(100)]
+        self.cv_csv = ("Potential (V),Current (A)\n" + "\n".join(rows) + "\n").encode("utf-8")
+
+    def test_arrow_matches_pandas(self):
+        """Test the Arrow result against the C engine for a plain CV file."""
+        df = _read_csv_arrow(self.cv_csv)
+
+        assert df is not None
+        pd.testing.assert_frame_equal(df, pd.read_csv(BytesIO(self.cv_csv)))
+
+    def test_read_csv_fast_plain_file(self):
+        """Test the full read of a plain UTF-8 file."""
+        df, encoding = _read_csv_fast(self.cv_csv)
+
+        assert encoding == "utf-8"
+        pd.testing.assert_frame_equal(df, pd.read_csv(BytesIO(self.cv_csv)))
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"Potential (V),Current (A),Comment,Comment\n0.1,1e-6,a,b\n0.2,2e-6,c,d\n",
+            b"Potential (V),Current (A),\n0.1,1e-6,a\n0.2,2e-6,b\n",
+        ],
+        ids=["duplicate", "blank"],
+    )
+    def test_irregular_headers_fall_back_to_pandas(self, data):
+        """Test that duplicate or blank headers get the C engine's column names."""
+        assert _read_csv_arrow(data) is None
+
+        df, _ = _read_csv_fast(data)
+        pd.testing.assert_frame_equal(df, pd.read_csv(BytesIO(data)))
+
+    def test_empty_column_is_float64(self):
+        """Test that an all-empty column reads as float64, as with the C engine."""
+        data = b"Potential (V),Current (A),Notes\n0.1,1e-6,\n0.2,2e-6,\n"
+        df, _ = _read_csv_fast(data)
+
+        assert df["Notes"].dtype == "float64"
+        assert df["Notes"].isna().all()
+
+    def test_malformed_file_raises_pandas_error(self):
+        """Test that a ragged row surfaces the pandas parser error, not Arrow's."""
+        data = self.cv_csv + b"0.5,1e-6,extra,fields\n"
+
+        with pytest.raises(pd.errors.ParserError, match="Expected 2 fields"):
+            _read_csv_fast(data)
+
+
+class TestCitationGeneration:
+    """Test suite for CITATION.cff author names."""
+
+    @pytest.mark.parametrize(
+        "creator, family, given",
+        [
+            ("Jane Doe", "Doe", "Jane"),
+            ("Jane  Q   Doe", "Doe", "Jane Q"),
+            ("  Jane Doe \t", "Doe", "Jane"),
+            ("Doe", "Doe", ""),
+            ("", "Unknown", ""),
+        ],
+    )
+    def test_author_names(self, creator, family, given):
+        """Test family and given names split from the creator field."""
+        citation = generate_citation({"attribution.creator": creator, "technique.name": "CV"})
+
+        assert f'- family-names: "{family}"\n  given-names: "{given}"\n' in citation
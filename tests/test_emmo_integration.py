@@ -0,0 +1,121 @@
+"""
+Tests for EMMOElectrochemistryIntegration class.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path for testing
+src_dir = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_dir))
+
+from echem_fairifier.core.emmo_integration import EMMOElectrochemistryIntegration
+
+
+class TestEMMOElectrochemistryIntegration:
+    """Test suite for EMMO vocabulary lookups."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.emmo = EMMOElectrochemistryIntegration()
+
+    @pytest.mark.parametrize(
+        "technique",
+        ["cyclic_voltammetry", "Cyclic Voltammetry", "CV", "cv", " CV ", "CyclicVoltammetry"],
+    )
+    def test_validate_technique_variants(self, technique):
+        """Test keys, labels, synonyms and abbreviations resolve to the same term."""
+        term = self.emmo.validate_technique(technique)
+        assert term is self.emmo.local_terms["cyclic_voltammetry"]
+
+    def test_validate_technique_abbreviations(self):
+        """Test every supported technique abbreviation is recognised."""
+        expected = {
+            "DPV": "differential_pulse_voltammetry",
+            "SWV": "square_wave_voltammetry",
+            "EIS": "electrochemical_impedance_spectroscopy",
+            "CA": "chronoamperometry",
+        }
+        for abbreviation, key in expected.items():
+            assert self.emmo.validate_technique(abbreviation) is self.emmo.local_terms[key]
+
+    def test_validate_unknown_technique(self):
+        """Test unknown techniques return None."""
+        assert self.emmo.validate_technique("Mass Spectrometry") is None
+        assert self.emmo.validate_technique("") is None
+
+    def test_predictive_search(self):
+        """Test prefix lookups over labels, synonyms and synonym words."""
+        labels = [term.label for term in self.emmo.predictive_search("volt")]
+        assert labels == ["CyclicVoltammetry", "DifferentialPulseVoltammetry", "SquareWaveVoltammetry"]
+        assert [term.label for term in self.emmo.predictive_search("Glassy")] == ["GlassyCarbon"]
+        assert self.emmo.predictive_search("xyz") == []
+
+    def test_suggest_terms(self):
+        """Test suggestions from names, definition words and categories."""
+        assert [term.label for term in self.emmo.suggest_terms("KNO3")] == ["PotassiumNitrate"]
+        assert [term.label for term in self.emmo.suggest_terms("potential steps")] == ["Chronoamperometry"]
+        assert self.emmo.suggest_terms("Ag/AgCl") == []
+
+        electrodes = self.emmo.suggest_terms("electrode", "electrodes")
+        assert [term.label for term in electrodes][:3] == ["WorkingElectrode", "ReferenceElectrode", "CounterElectrode"]
+        assert len(self.emmo.suggest_terms("")) == 5
+
+    def test_controlled_vocabulary(self):
+        """Test category vocabularies are filtered by keyword."""
+        techniques = self.emmo.get_controlled_vocabulary("techniques")
+        assert set(techniques) == {
+            "cyclic_voltammetry",
+            "differential_pulse_voltammetry",
+            "square_wave_voltammetry",
+            "electrochemical_impedance_spectroscopy",
+            "chronoamperometry",
+        }
+        assert "glassy_carbon" in self.emmo.get_controlled_vocabulary("materials")
+        assert len(self.emmo.get_controlled_vocabulary("unknown")) == 0
+
+    def test_suggest_terms_cached(self):
+        """Test one cached index walk serves every category filter as fresh lists."""
+        first = self.emmo.suggest_terms("Electrode", "electrodes")
+        first.clear()
+        second = self.emmo.suggest_terms("electrode", "electrodes")
+        assert len(second) == 4
+        assert [term.label for term in self.emmo.suggest_terms("electrode", "materials")] == ["Platinum"]
+        assert self.emmo._match_keys_cached.cache_info().hits == 2
+
+    def test_enrich_does_not_mutate_input(self):
+        """Test enrichment leaves the caller's metadata unchanged."""
+        metadata = {
+            "technique": {"name": "CV", "parameters": {"scan_rate": 0.1}},
+            "experimental_setup": {"working_electrode": "GC"},
+        }
+        enriched = self.emmo.enrich_metadata_with_emmo(metadata)
+
+        assert enriched["technique"]["emmo_label"] == "CyclicVoltammetry"
+        assert "emmo_iri" not in metadata["technique"]
+        assert "emmo_compliance" not in metadata
+        assert enriched["experimental_setup"] is metadata["experimental_setup"]
+
+    def test_terms_are_immutable(self):
+        """Test shared terms cannot be modified and can be used as set members."""
+        term = self.emmo.validate_technique("CV")
+        with pytest.raises(AttributeError):
+            term.label = "Changed"
+        assert term.synonyms == ("CV", "cyclic voltammetry")
+        assert len({term, self.emmo.local_terms["cyclic_voltammetry"]}) == 1
+
+    def test_enrich_skips_blank_and_single_character_values(self):
+        """Test vocabulary mapping ignores values too short to match meaningfully."""
+        metadata = {
+            "experimental_setup": {
+                "working_electrode": "vitreous carbon",
+                "reference_electrode": "   ",
+                "counter_electrode": "c",
+                "temperature": 25,
+            },
+        }
+        mapping = self.emmo.enrich_metadata_with_emmo(metadata)["emmo_compliance"]["vocabulary_mapping"]
+
+        assert list(mapping) == ["working_electrode"]
+        assert mapping["working_electrode"]["emmo_suggestion"] == "GlassyCarbon"
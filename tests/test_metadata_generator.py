@@ -11,6 +11,10 @@ from datetime import datetime
 src_dir = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_dir))
 
+import numpy as np
+import yaml
+
+from echem_fairifier.config.techniques import ElectrochemicalTechniques
 from echem_fairifier.core.metadata_generator import FAIRMetadataGenerator
 
 
@@ -92,6 +96,28 @@ class TestFAIRMetadataGenerator:
         assert "dataset_link: test.csv" in yaml_str
         assert yaml_str.startswith("technique:")  # YAML format check
 
+    def test_yaml_generation_with_default_parameters(self):
+        """Test YAML dump of metadata built from the technique defaults."""
+        defaults = ElectrochemicalTechniques.get_default_values("CV")
+        metadata = self.generator.generate_metadata(
+            technique="CV",
+            technique_parameters=defaults,
+            experimental_details=self.sample_experimental_details,
+            dataset_info=self.sample_dataset_info,
+        )
+        yaml_str = self.generator.generate_yaml(metadata)
+
+        assert yaml.safe_load(yaml_str)["technique"]["parameters"] == defaults
+
+    def test_yaml_generation_with_numpy_scalars(self):
+        """Test YAML dump of numpy scalars such as DataFrame statistics."""
+        metadata = self.generator.create_minimal_metadata(
+            "CV", {"scan_rate": np.float64(0.1), "cycles": np.int64(3), "reversible": np.bool_(True)}, "test.csv"
+        )
+        parameters = yaml.safe_load(self.generator.generate_yaml(metadata))["technique_parameters"]
+
+        assert parameters == {"scan_rate": 0.1, "cycles": 3, "reversible": True}
+
     def test_metadata_validation(self):
         """Test metadata validation."""
         # Valid metadata
@@ -4,7 +4,9 @@ Tests for ECDataValidator class.
 
 import streamlit as st
 import pytest
+import numpy as np
 import pandas as pd
+from decimal import Decimal
 import sys
 from pathlib import Path
 
@@ -89,6 +91,21 @@ class TestECDataValidator:
         assert len(results_invalid["errors"]) > 0
         assert len(results_invalid["warnings"]) > 0
 
+    def test_numeric_parameter_types(self):
+        """Test NumPy and Decimal parameter values are accepted and strings rejected."""
+        results = self.validator._validate_cv_parameters(
+            {"scan_rate": np.int64(20), "start_potential": Decimal("0.5"), "end_potential": np.float32(0.55)}
+        )
+        assert results["errors"] == []
+        assert len(results["warnings"]) == 2  # High scan rate and narrow window
+
+        results = self.validator._validate_cv_parameters({"scan_rate": "0.1", "start_potential": "low", "end_potential": 1})
+        assert results["errors"] == ["CV scan rate must be positive number"]
+        assert results["warnings"] == []
+
+        results = self.validator._validate_eis_parameters({"ac_amplitude": "high"})
+        assert results["warnings"] == []
+
     def test_eis_parameter_validation(self):
         """Test EIS-specific parameter validation."""
         # Valid EIS parameters
@@ -148,6 +165,64 @@ class TestECDataValidator:
         warning_text = " ".join(results["warnings"])
         assert "duplicate" in warning_text.lower() or "missing" in warning_text.lower()
 
+    def test_duplicate_rows_counted(self):
+        """Test duplicate rows are counted across all columns, including text and NaN."""
+        data = pd.DataFrame(
+            {
+                "Potential (V)": [0.1, None, 0.1, None, 0.2],
+                "Label": ["a", None, "a", None, "a"],
+            }
+        )
+
+        results = self.validator.validate_data_file(data, "CV")
+
+        assert "Found 2 duplicate rows" in results["warnings"]
+
+    def test_duplicate_column_headers(self):
+        """Test repeated header labels are checked column by column instead of failing."""
+        data = pd.DataFrame(
+            [["0.1", "1e-6", "ok", "a"], ["0.2", "2e-6", "ok", "b"], ["0.3", "n/a", "ok", "c"], ["0.4", "4e-6", "ok", "d"]],
+            columns=["Potential (V)", "Current (A)", "Comment", "Comment"],
+        )
+
+        results = self.validator.validate_data_file(data, "CV")
+
+        assert results["errors"] == []
+        assert "Column 'Current (A)' has 1 non-numeric values" in results["warnings"]
+
+    def test_non_numeric_entries_detected(self):
+        """Test that stray text in a numeric column is reported."""
+        data = pd.DataFrame(
+            {
+                "Potential (V)": ["0.1", "0.2", "0.3", "0.4", "0.5"],
+                "Current (A)": ["1e-6", "2e-6", "n/a", "4e-6", "5e-6"],
+            }
+        )
+
+        results = self.validator.validate_data_file(data, "CV")
+
+        warning_text = " ".join(results["warnings"])
+        assert "'Current (A)' has 1 non-numeric values" in warning_text
+        assert "'Potential (V)'" not in warning_text
+
+    def test_metadata_validation_with_dataframe(self, sample_cv_data):
+        """Test that data file checks are merged when a DataFrame is supplied."""
+        metadata = {
+            "experiment_id": "test-uuid",
+            "technique": {"name": "CV", "parameters": {"scan_rate": 0.1}},
+            "experimental_setup": {
+                "working_electrode": "GC",
+                "reference_electrode": "Ag/AgCl",
+                "electrolyte": "0.1 M KCl",
+            },
+        }
+
+        without_df = self.validator.validate_metadata(metadata)
+        with_df = self.validator.validate_metadata(metadata, df=sample_cv_data)
+
+        assert not any("Data file contains" in item for item in without_df["info"])
+        assert any("Data file contains 17 rows" in item for item in with_df["info"])
+
     def test_empty_dataframe_validation(self):
         """Test validation of empty dataframe."""
         empty_df = pd.DataFrame()
@@ -344,6 +419,18 @@ class TestECDataValidator:
         checksum3 = self.validator.calculate_data_checksum(different_data)
         assert checksum != checksum3
 
+    def test_checksum_streams_paths_and_file_objects(self, tmp_path):
+        """Test paths and file objects hash to the same digest as the raw bytes."""
+        test_data = b"potential,current\n" * 200_000  # Spans several read chunks
+        data_file = tmp_path / "data.csv"
+        data_file.write_bytes(test_data)
+        expected = self.validator.calculate_data_checksum(test_data)
+
+        assert self.validator.calculate_data_checksum(data_file) == expected
+        assert self.validator.calculate_data_checksum(str(data_file)) == expected
+        with open(data_file, "rb") as f:
+            assert self.validator.calculate_data_checksum(f) == expected
+
     def test_schema_loading_fallback(self):
         """Test schema loading with fallback to minimal schema."""
         # Test with non-existent schema path
@@ -351,6 +438,30 @@ class TestECDataValidator:
         assert validator_with_bad_path.schema is not None
         assert "type" in validator_with_bad_path.schema
 
+    def test_schema_validation_errors(self):
+        """Test schema violations are reported as errors."""
+        results = self.validator.validate_metadata({"experiment_id": "test-uuid"})
+        assert any("Schema validation error" in error for error in results["errors"])
+        assert not self.validator.is_valid_metadata({"experiment_id": "test-uuid"})
+
+    def test_selected_checks_only(self):
+        """Test validate_metadata runs only the requested stages."""
+        metadata = {"experiment_id": "test-uuid", "technique": {"name": "CV", "parameters": {"scan_rate": -1}}}
+
+        results = self.validator.validate_metadata(metadata, checks=("technique",))
+
+        assert results["errors"] == ["CV scan rate must be positive number"]
+        assert results["warnings"] == []
+        assert results["fair_score"] == 0.0
+
+        # A one-shot iterable still selects every stage it names
+        results = self.validator.validate_metadata(metadata, checks=(c for c in ("fair", "technique")))
+        assert results["errors"] == ["CV scan rate must be positive number"]
+        assert results["fair_score"] > 0.0
+
+        with pytest.raises(ValueError, match="techniqe"):
+            self.validator.validate_metadata(metadata, checks=("techniqe",))
+
     def test_comprehensive_metadata_validation(self):
         """Test full metadata validation integration."""
         metadata = {